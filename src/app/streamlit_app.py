@@ -1,6 +1,3 @@
-import streamlit as st
-import cv2
-import mediapipe as mp
 import tempfile
 import os
 import sys
@@ -9,67 +6,13 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
 # --- Custom Imports ---
+# Streamlit, OpenCV and MediaPipe are imported inside the functions that use
+# them, so importing this module (e.g. for render_feedback) stays cheap.
 from src.config.load_config import load_rule_evaluators, load_rules_description_config
 from src.utils.pose_utils import get_pose_landmarks_dict
 from src.utils.draw_feedback import draw_feedback
-from src.loggingInfo.loggingFile import logging
-
-# -----------------------------
-# Initialize MediaPipe and Rules
-# -----------------------------
-mp_drawing = mp.solutions.drawing_utils
-mp_pose = mp.solutions.pose
-pose = mp_pose.Pose(static_image_mode=False, min_detection_confidence=0.5, min_tracking_confidence=0.5)
-evaluators = load_rule_evaluators("configs/rules_config.yaml")
-
-# -----------------------------
-# Streamlit UI Setup
-# -----------------------------
-st.set_page_config(page_title="AI Exercise Form Checker", layout="wide")
-st.title("🏋️‍♀️ Real-Time or Uploaded Video Pose Form Feedback")
-
-mode = st.radio("Choose input mode", ["Upload Video", "Webcam"])
-exercise_type = st.selectbox("Choose Exercise", list(evaluators.keys()))
-
-main_col, right_sidebar = st.columns([3, 1])
-feedback_container = right_sidebar.empty()
-
-rules_config = load_rules_description_config()
-
-exercise_key = exercise_type.lower().replace(" ", "_")  # e.g., "Bicep Curl" → "bicep_curl"
-exercise_rules = rules_config.get(exercise_key, {})
-
-with right_sidebar:
-
-    # Create reusable containers for each section
-    feedback_title = st.empty()
-    warning_container = st.empty()
-    progress_container = st.empty()
-    metric_container = st.empty()
-    rep_container = st.empty()
-
-
-    # Mentioned the exercise rules
-    if exercise_rules:
-        st.markdown(f"### {exercise_rules['title']}")
-        for rule in exercise_rules["rules"]:
-            st.info(f"- {rule}")
-    else:
-        st.warning("No rules found for the selected exercise.")
-
-    # Sidebar purpose and rules
-    st.markdown("## 📌 Purpose & Rules")
-    
-    st.info("""
-    This sidebar shows real-time feedback on your exercise form.
-
-    **Detection Logic**:
-    - If the rep count stays 0, your movement is **not matching** the required motion pattern.
-    - Even if accuracy is > 0%, a 0 count indicates form is **invalid**.
-
-    Improve your form until rep count increases and rule violations disappear.
-    """)
-    
+from src.detector.mediapipe_detector import create_pose, get_pose_connections
+from src.loggingInfo.loggingFile import logging, setup_logging
 
 
 # -----------------------------
@@ -92,7 +35,8 @@ def render_feedback(feedback):
 
     return rep_count, unique_msgs, passed, rule_count
 
-def update_sidebar(rep_count, rule_msgs, total_passed, total_rules):
+def update_sidebar(sidebar, rep_count, rule_msgs, total_passed, total_rules):
+    feedback_title, warning_container, progress_container, metric_container, rep_container = sidebar
     pass_ratio = (total_passed / total_rules) * 100 if total_rules > 0 else 0
     unique_msgs = list(set(rule_msgs)) if rule_msgs else []
 
@@ -134,6 +78,8 @@ def update_sidebar(rep_count, rule_msgs, total_passed, total_rules):
 
 
 def draw_landmarks(frame, pose_landmarks, passed=True):
+    import cv2
+
     landmark_color = (0, 255, 0) if passed else (0, 0, 255)  # Green or Red
     edge_color = (100, 200, 255)
 
@@ -144,7 +90,7 @@ def draw_landmarks(frame, pose_landmarks, passed=True):
         if 0 <= cx < w and 0 <= cy < h:
             cv2.circle(frame, (cx, cy), 5, landmark_color, -1)
 
-    for connection in mp_pose.POSE_CONNECTIONS:
+    for connection in get_pose_connections():
         start_idx, end_idx = connection
         start = pose_landmarks.landmark[start_idx]
         end = pose_landmarks.landmark[end_idx]
@@ -155,13 +101,15 @@ def draw_landmarks(frame, pose_landmarks, passed=True):
 
     return frame
 
-def process_frame(frame, exercise_type):
+def process_frame(frame, evaluator, pose):
+    import cv2
+
     image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
     result = pose.process(image_rgb)
 
     if result.pose_landmarks:
         landmarks = get_pose_landmarks_dict(result.pose_landmarks)
-        feedback = evaluators[exercise_type].evaluate_all(landmarks)
+        feedback = evaluator.evaluate_all(landmarks)
         frame = draw_feedback(frame, feedback)
         frame = draw_landmarks(frame, result.pose_landmarks, passed=feedback["rep_count"] > 0)
         logging.info(f"Feedback: {feedback}")
@@ -169,75 +117,148 @@ def process_frame(frame, exercise_type):
     else:
         return frame, None
 
-# -----------------------------
-# Webcam Mode
-# -----------------------------
-if mode == "Webcam":
-    with main_col:
-        FRAME_WINDOW = st.image([])
-        cap = cv2.VideoCapture(0)
-        st.caption("Click 'Stop' to end webcam feed.")
-        stop_btn = st.button("Stop")
-        last_rep_count = 0
-        total_passed = 0
-        total_rules = 0
-
-        while cap.isOpened() and not stop_btn:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            frame, feedback = process_frame(frame, exercise_type)
-
-            if feedback:
-                rep_count, rule_msgs, passed, rule_count = render_feedback(feedback)
-                total_passed += passed
-                total_rules += rule_count
-                
-                update_sidebar(rep_count, rule_msgs, total_passed, total_rules)
-            else:
-                update_sidebar(0, ["Pose not detected. Please stay in frame."], 0, 1)
-
-            FRAME_WINDOW.image(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-
-        cap.release()
-        st.write("Webcam session ended.")
 
-# -----------------------------
-# Uploaded Video Mode
-# -----------------------------
-else:
-    with main_col:
-        uploaded_file = st.file_uploader("Upload an MP4 video", type=["mp4"])
+def main():
+    import streamlit as st
+    import cv2
+
+    setup_logging()
+
+    # -----------------------------
+    # Initialize Rules and the per-session pose model
+    # -----------------------------
+    evaluators = load_rule_evaluators("configs/rules_config.yaml")
+
+    # Built once per browser session and kept warm across reruns; never
+    # shared between sessions since it holds per-stream tracking state.
+    if "pose" not in st.session_state:
+        st.session_state["pose"] = create_pose()
+    pose = st.session_state["pose"]
 
-        if uploaded_file is not None:
-            tfile = tempfile.NamedTemporaryFile(delete=False)
-            tfile.write(uploaded_file.read())
-            video_path = tfile.name
+    # -----------------------------
+    # Streamlit UI Setup
+    # -----------------------------
+    st.set_page_config(page_title="AI Exercise Form Checker", layout="wide")
+    st.title("🏋️‍♀️ Real-Time or Uploaded Video Pose Form Feedback")
 
-            cap = cv2.VideoCapture(video_path)
-            stframe = st.empty()
+    mode = st.radio("Choose input mode", ["Upload Video", "Webcam"])
+    exercise_type = st.selectbox("Choose Exercise", list(evaluators.keys()))
+
+    main_col, right_sidebar = st.columns([3, 1])
+    feedback_container = right_sidebar.empty()
+
+    rules_config = load_rules_description_config()
+
+    exercise_key = exercise_type.lower().replace(" ", "_")  # e.g., "Bicep Curl" → "bicep_curl"
+    exercise_rules = rules_config.get(exercise_key, {})
+
+    with right_sidebar:
+
+        # Create reusable containers for each section
+        feedback_title = st.empty()
+        warning_container = st.empty()
+        progress_container = st.empty()
+        metric_container = st.empty()
+        rep_container = st.empty()
+        sidebar = (feedback_title, warning_container, progress_container, metric_container, rep_container)
+
+
+        # Mentioned the exercise rules
+        if exercise_rules:
+            st.markdown(f"### {exercise_rules['title']}")
+            for rule in exercise_rules["rules"]:
+                st.info(f"- {rule}")
+        else:
+            st.warning("No rules found for the selected exercise.")
+
+        # Sidebar purpose and rules
+        st.markdown("## 📌 Purpose & Rules")
+
+        st.info("""
+        This sidebar shows real-time feedback on your exercise form.
+
+        **Detection Logic**:
+        - If the rep count stays 0, your movement is **not matching** the required motion pattern.
+        - Even if accuracy is > 0%, a 0 count indicates form is **invalid**.
+
+        Improve your form until rep count increases and rule violations disappear.
+        """)
+
+    # -----------------------------
+    # Webcam Mode
+    # -----------------------------
+    if mode == "Webcam":
+        with main_col:
+            FRAME_WINDOW = st.image([])
+            cap = cv2.VideoCapture(0)
+            st.caption("Click 'Stop' to end webcam feed.")
+            stop_btn = st.button("Stop")
+            pose.reset()  # Start tracking from scratch for this stream
             last_rep_count = 0
             total_passed = 0
             total_rules = 0
 
-            while cap.isOpened():
+            while cap.isOpened() and not stop_btn:
                 ret, frame = cap.read()
                 if not ret:
                     break
 
-                frame, feedback = process_frame(frame, exercise_type)
+                frame, feedback = process_frame(frame, evaluators[exercise_type], pose)
 
                 if feedback:
                     rep_count, rule_msgs, passed, rule_count = render_feedback(feedback)
+                    total_passed += passed
+                    total_rules += rule_count
 
-                    # Use only current frame stats (not accumulated)
-                    update_sidebar(rep_count, rule_msgs, passed, rule_count)
+                    update_sidebar(sidebar, rep_count, rule_msgs, total_passed, total_rules)
                 else:
-                    update_sidebar(0, ["Pose not detected. Please stay in frame."], 0, 1)
-
+                    update_sidebar(sidebar, 0, ["Pose not detected. Please stay in frame."], 0, 1)
 
-                stframe.image(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), channels="RGB")
+                FRAME_WINDOW.image(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
 
             cap.release()
-            st.success("✅ Video processing complete!")
\ No newline at end of file
+            st.write("Webcam session ended.")
+
+    # -----------------------------
+    # Uploaded Video Mode
+    # -----------------------------
+    else:
+        with main_col:
+            uploaded_file = st.file_uploader("Upload an MP4 video", type=["mp4"])
+
+            if uploaded_file is not None:
+                tfile = tempfile.NamedTemporaryFile(delete=False)
+                tfile.write(uploaded_file.read())
+                video_path = tfile.name
+
+                cap = cv2.VideoCapture(video_path)
+                stframe = st.empty()
+                pose.reset()  # Don't carry tracking over from a previous video
+                last_rep_count = 0
+                total_passed = 0
+                total_rules = 0
+
+                while cap.isOpened():
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+
+                    frame, feedback = process_frame(frame, evaluators[exercise_type], pose)
+
+                    if feedback:
+                        rep_count, rule_msgs, passed, rule_count = render_feedback(feedback)
+
+                        # Use only current frame stats (not accumulated)
+                        update_sidebar(sidebar, rep_count, rule_msgs, passed, rule_count)
+                    else:
+                        update_sidebar(sidebar, 0, ["Pose not detected. Please stay in frame."], 0, 1)
+
+
+                    stframe.image(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), channels="RGB")
+
+                cap.release()
+                st.success("✅ Video processing complete!")
+
+
+if __name__ == "__main__":
+    main()
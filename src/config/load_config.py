@@ -1,18 +1,30 @@
 import os
-import sys
+import importlib
 import yaml
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
-
-from src.rules.bicep_curl_rule import BicepCurlRules
-from src.rules.lateral_raise_rule import LateralRaiseRules
-
-# Map each label to its corresponding rule class
+# Map each label to its corresponding rule class ("module:ClassName").
+# Rule modules are only imported when a config actually enables them.
 RULE_CLASSES = {
-    "Bicep Curl": BicepCurlRules,
-    "Lateral Raise": LateralRaiseRules
+    "Bicep Curl": "src.rules.bicep_curl_rule:BicepCurlRules",
+    "Lateral Raise": "src.rules.lateral_raise_rule:LateralRaiseRules"
 }
 
+def get_rule_class(exercise_name: str):
+    """
+    Import and return the rule class registered for an exercise.
+
+    Args:
+        exercise_name (str): Exercise label as used in the YAML config.
+
+    Returns:
+        type | None: The rule class, or None if the exercise is unknown.
+    """
+    target = RULE_CLASSES.get(exercise_name)
+    if target is None:
+        return None
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
 def load_rule_evaluators(config_path: str):
     """
     Load exercise rule evaluators from a YAML config file.
@@ -31,7 +43,7 @@ def load_rule_evaluators(config_path: str):
 
     evaluators = {}
     for exercise_name in config.get("exercises", []):
-        rule_class = RULE_CLASSES.get(exercise_name)
+        rule_class = get_rule_class(exercise_name)
         if rule_class is None:
             print(f"Warning: No rule class found for exercise '{exercise_name}'. Skipping.")
             continue
@@ -0,0 +1,29 @@
+def create_pose():
+    """
+    Build a MediaPipe pose estimator.
+
+    MediaPipe is imported on the first call only, so modules that never run
+    pose detection (rule evaluation, config loading) don't pay for it.
+
+    The estimator runs in tracking mode and keeps tracking/smoothing state
+    between frames, so it must not be shared between concurrent streams.
+    Keep one instance per session and call ``reset()`` on it before each new
+    video or webcam stream.
+
+    Returns:
+        mediapipe.solutions.pose.Pose: A new pose estimator.
+    """
+    import mediapipe as mp
+
+    return mp.solutions.pose.Pose(
+        static_image_mode=False,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+    )
+
+
+def get_pose_connections():
+    """Return the landmark index pairs used to draw the pose skeleton."""
+    import mediapipe as mp
+
+    return mp.solutions.pose.POSE_CONNECTIONS
@@ -1,16 +1,34 @@
 import os
 import logging
-from time import asctime
 from datetime import datetime
 
-logFileExtPath = f"{datetime.now().strftime('%m_%d_%Y_%H_%M_%S')}_logs"
 logFile = "logs"
-os.makedirs(logFile, exist_ok=True)
+logFilePath = None
 
-logFilePath = os.path.join(f"{logFile}/{logFileExtPath}.log")
 
-logging.basicConfig(
-    level=logging.INFO,
-    filename=logFilePath,
-    format=f"[%(asctime)s] %(lineno)d %(name)s - %(levelname)s - %(message)s" 
-)
\ No newline at end of file
+def setup_logging():
+    """
+    Configure file logging on first use.
+
+    Importing this module no longer creates the ``logs/`` directory or a log
+    file; entry points call this once at start-up instead. Repeated calls
+    return the already configured log file path.
+
+    Returns:
+        str: Path of the active log file.
+    """
+    global logFilePath
+    if logFilePath is not None:
+        return logFilePath
+
+    logFileExtPath = f"{datetime.now().strftime('%m_%d_%Y_%H_%M_%S')}_logs"
+    os.makedirs(logFile, exist_ok=True)
+
+    logFilePath = os.path.join(f"{logFile}/{logFileExtPath}.log")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        filename=logFilePath,
+        format=f"[%(asctime)s] %(lineno)d %(name)s - %(levelname)s - %(message)s" 
+    )
+    return logFilePath
@@ -1,12 +1,7 @@
 import numpy as np
-import sys
-import os
-
-# Ensure correct import paths
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import logging
 
 from src.rules.base_rules import BaseRuleSet
-from src.loggingInfo.loggingFile import logging
 
 
 def get_z_safe(point):
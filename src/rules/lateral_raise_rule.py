@@ -1,11 +1,7 @@
 import numpy as np
-
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import logging
 
 from src.rules.base_rules import BaseRuleSet
-from src.loggingInfo.loggingFile import logging
 
 class LateralRaiseRules(BaseRuleSet):
     def __init__(self):
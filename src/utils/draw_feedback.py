@@ -1,5 +1,3 @@
-import cv2
-
 def draw_feedback(frame, feedback):
     """
     Draws rule evaluation feedback and rep count on the video frame.
@@ -11,6 +9,8 @@ def draw_feedback(frame, feedback):
     Returns:
         np.array: The annotated video frame.
     """
+    import cv2
+
     font = cv2.FONT_HERSHEY_SIMPLEX
     font_scale = 1  # Increase for larger text
     font_color = (0, 0, 225)
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+# Modules that short-lived CLI / worker processes typically start from
+DEFAULT_MODULES = [
+    "src.config.load_config",
+    "src.rules.bicep_curl_rule",
+    "src.rules.lateral_raise_rule",
+    "src.app.streamlit_app",
+]
+
+
+def measure_import_time(module_name: str, top: int = 10):
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module_name (str): Dotted module path to import.
+        top (int): Number of slowest imports to return.
+
+    Returns:
+        tuple: (module_us, baseline_us, [(cumulative_us, imported_module), ...])
+        where ``module_us`` is the cumulative cost of the module and its parent
+        packages, ``baseline_us`` covers the interpreter's own start-up imports
+        (``site``, ``encodings``, ...) and the list holds the ``top`` slowest
+        imports by cumulative time.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        stderr_lines = result.stderr.strip().splitlines()
+        if not stderr_lines:
+            raise RuntimeError(f"exited with return code {result.returncode}")
+        raise RuntimeError(stderr_lines[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        # Format: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        entries.append((int(cumulative), name[1:]))
+
+    # Nested imports are indented; top-level rows are either the target
+    # module (and its parent packages) or the interpreter's own start-up
+    parts = module_name.split(".")
+    own_modules = {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+    module_total = 0
+    baseline_total = 0
+    for cumulative, name in entries:
+        if name.startswith(" "):
+            continue
+        if name in own_modules:
+            module_total += cumulative
+        else:
+            baseline_total += cumulative
+
+    slowest = sorted(((cumulative, name.strip()) for cumulative, name in entries), reverse=True)
+    return module_total, baseline_total, slowest[:top]
+
+
+def main(modules=None, top: int = 10):
+    for module_name in modules or DEFAULT_MODULES:
+        try:
+            module_total, baseline_total, slowest = measure_import_time(module_name, top=top)
+        except RuntimeError as e:
+            print(f"{module_name}: import failed ({e})")
+            continue
+        print(f"{module_name}: {module_total / 1000:.1f} ms "
+              f"(interpreter start-up: {baseline_total / 1000:.1f} ms)")
+        for cumulative, name in slowest:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])